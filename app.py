@@ -1,96 +1,317 @@
-from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import AbstractSet, Dict, List
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 import yfinance as yf
-from pydantic import BaseModel, Field
+from filelock import FileLock
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
+# Directory holding the on-disk parquet cache of yfinance downloads
+CACHE_DIR = Path.home() / ".cache" / "eth_vs_btc"
 
-class CryptoData(BaseModel):
+# History downloaded until the user selects a range reaching past it; it spans twice the
+# default date range so that the full history isn't needed for the initial view
+RECENT_PERIOD = "2y"
+
+# Maximum number of points per price trace sent to the browser
+MAX_PLOT_POINTS = 2000
+
+
+@dataclass(slots=True)
+class CryptoData:
     """Data model for cryptocurrency information."""
 
     symbol: str
-    data: pd.DataFrame
-    min_date: datetime
-    max_date: datetime
-    return_value: Optional[float] = None
-    return_color: Optional[str] = None
+    index_ns: np.ndarray  # Dates as sorted int64 nanoseconds
+    close_arr: np.ndarray  # Close prices (float32 is plenty for charting and shrinks the plot payload)
+    ret_arr: np.ndarray  # Cumulative log returns in % (float32)
+    min_date: date
+    max_date: date
+
 
-    class Config:
-        arbitrary_types_allowed = True  # Allow pd.DataFrame
+@dataclass(slots=True)
+class AssetPair:
+    """Two cryptocurrencies aligned on the dates they both have data for."""
 
+    src_asset: CryptoData
+    compare_asset: CryptoData
+    index_ns: np.ndarray  # Shared dates as sorted int64 nanoseconds
+    ret_arr: np.ndarray  # Cumulative log returns in %, one row per asset (2 x N)
+    norm_close_arr: np.ndarray  # Close prices indexed to 100 on the first shared date, one row per asset (2 x N)
+    min_date: date
+    max_date: date
 
-class ComparisonResult(BaseModel):
+
+@dataclass(slots=True)
+class ComparisonResult:
     """Results from comparing two cryptocurrencies."""
 
     start_date: datetime
     end_date: datetime
-    src_asset: CryptoData
-    compare_asset: CryptoData
+    pair: AssetPair
+    src_return: float  # Return of the source asset over the selected range, in %
+    compare_return: float  # Return of the comparison asset over the selected range, in %
+
+
+def _fetch_history(symbol: str, **kwargs) -> pd.DataFrame:
+    """
+    Fetch the daily price history of a ticker from Yahoo Finance.
+
+    Unlike yf.download, which resets module-level state on every call, Ticker.history
+    is safe to call from several threads at once.
+
+    Args:
+        symbol: The yfinance ticker (e.g., 'BTC-USD')
+        **kwargs: Forwarded to yf.Ticker.history (e.g., period or start)
 
-    class Config:
-        arbitrary_types_allowed = True
+    Returns:
+        DataFrame containing the daily close prices, indexed by (timezone naive) date; empty
+        if the download failed
+    """
+    data = yf.Ticker(symbol).history(auto_adjust=False, **kwargs)
+
+    # Failed downloads don't raise but return an empty frame without a DatetimeIndex
+    if data.empty or not isinstance(data.index, pd.DatetimeIndex):
+        data = pd.DataFrame({"Close": []}, index=pd.DatetimeIndex([], name="Date"))
+    else:
+        data.index = data.index.tz_localize(None)
+
+    # Only the close price is used; keep it as an Arrow-backed float32 column, which is
+    # smaller in memory and is written to parquet as is
+    return data[["Close"]].astype({"Close": "float32[pyarrow]"})
+
+
+def _cached_download(symbol: str, period: str = "max") -> pd.DataFrame:
+    """
+    Download the daily price history of a ticker, backed by a parquet file on disk.
+
+    The requested period is only downloaded on the first call; afterwards only the rows
+    since the last cached day are fetched (that day included, since it may have been
+    cached as a partial day). Nothing is fetched if the cache is already up to date.
+
+    Args:
+        symbol: The yfinance ticker (e.g., 'BTC-USD')
+        period: The yfinance period of the initial download (e.g., '2y' or 'max')
+
+    Returns:
+        DataFrame containing the daily close prices of the ticker
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = CACHE_DIR / f"{symbol}_{period}.parquet"
+    today = datetime.now(timezone.utc).date()
+
+    with FileLock(f"{path}.lock"):
+        if path.exists():
+            # Whether read_parquet restores the pyarrow-backed dtype or falls back to numpy float32
+            # depends on the pandas metadata of the file, so pin the dtype the rest of the app expects
+            data = pd.read_parquet(path, columns=["Close"]).astype({"Close": "float32[pyarrow]"})
+            last_date = data.index.max().date()
+            if last_date >= today:
+                return data
+            delta = _fetch_history(symbol, start=last_date)
+            if delta.empty:
+                # Fall back to the cached history if the download failed
+                return data
+            data = pd.concat([data, delta])
+            data = data[~data.index.duplicated(keep="last")]
+        else:
+            data = _fetch_history(symbol, period=period)
+
+        # Don't persist failed (empty) downloads
+        if not data.empty:
+            data.to_parquet(path, compression="zstd")
+
+    return data
+
+
+def _log_returns(close: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Compute the cumulative log returns (in %) relative to the first close.
+
+    Log returns are additive, so the return over any window is the difference of its
+    two endpoints. Every step writes into `out`, so no intermediate arrays are allocated.
+
+    Args:
+        close: Close prices
+        out: Preallocated output array with the same length as close
+
+    Returns:
+        The out array
+    """
+    np.divide(close, close[0], out=out, casting="same_kind")
+    np.log(out, out=out)
+    out *= 100.0
+    return out
 
 
 @st.cache_data
-def get_crypto_data(symbol: str) -> CryptoData:
+def get_crypto_data(symbol: str, full_history: bool = False) -> CryptoData:
     """
     Fetch and process cryptocurrency data.
 
     Args:
         symbol: The cryptocurrency symbol (e.g., 'BTC', 'ETH')
+        full_history: Whether to fetch the full history rather than the RECENT_PERIOD
 
     Returns:
         CryptoData object containing the processed data and metadata
+
+    Raises:
+        ValueError: If no price data could be downloaded for the symbol
     """
-    data = yf.download(f"{symbol}-USD", period="max")
+    data = _cached_download(f"{symbol}-USD", "max" if full_history else RECENT_PERIOD)
     data.dropna(inplace=True)
-    data["Return"] = data["Close"].pct_change().cumsum() * 100
-    data.index = pd.to_datetime(data.index)
+    if data.empty:
+        raise ValueError(f"No price data could be downloaded for {symbol}, please try again later.")
+
+    close = data["Close"].to_numpy(dtype=np.float64).ravel()
+    ret = _log_returns(close, np.empty(len(close), dtype=np.float32))
+
+    # yfinance and the parquet cache already return a DatetimeIndex, which doesn't need a copy
+    if not isinstance(data.index, pd.DatetimeIndex):
+        data.index = pd.to_datetime(data.index)
+
+    # Only keep the columns that are used, as contiguous arrays, along with the date bounds as
+    # the date objects the slider takes (the index is sorted, so they are its endpoints)
+    return CryptoData(
+        symbol=symbol,
+        index_ns=data.index.as_unit("ns").asi8,
+        close_arr=close.astype(np.float32),
+        ret_arr=ret,
+        min_date=data.index[0].date(),
+        max_date=data.index[-1].date(),
+    )
 
-    return CryptoData(symbol=symbol, data=data, min_date=data.index.min(), max_date=data.index.max())
 
+def fetch_crypto_data(symbols: List[str], full_history: AbstractSet[str] = frozenset()) -> Dict[str, CryptoData]:
+    """
+    Fetch the data of several cryptocurrencies concurrently.
 
-def get_heading_level(percentage: float) -> str:
+    Args:
+        symbols: The cryptocurrency symbols (e.g., ['BTC', 'ETH'])
+        full_history: The symbols for which to fetch the full history
+
+    Returns:
+        Dictionary mapping each symbol to its CryptoData object
     """
-    Determine markdown heading level based on return magnitude.
+    # Attach the script run context to the worker threads so st.cache_data works in them
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=len(symbols), initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        return dict(zip(symbols, executor.map(get_crypto_data, symbols, [s in full_history for s in symbols])))
+
+
+def align_assets(src_data: CryptoData, compare_data: CryptoData) -> AssetPair:
+    """
+    Align the returns and prices of two cryptocurrencies on the dates they both have data for.
 
     Args:
-        percentage: The return percentage value
+        src_data: Source asset data (e.g., BTC)
+        compare_data: Comparison asset data (e.g., ETH)
 
     Returns:
-        String representing the markdown heading level
+        AssetPair object containing the stacked returns and prices over the shared dates
     """
-    if abs(percentage) >= 100:
-        return "#"
-    elif abs(percentage) >= 50:
-        return "##"
-    elif abs(percentage) >= 10:
-        return "###"
-    return "####"
+    index_ns, src_idx, compare_idx = np.intersect1d(
+        src_data.index_ns, compare_data.index_ns, assume_unique=True, return_indices=True
+    )
+    close_arr = np.vstack([src_data.close_arr[src_idx], compare_data.close_arr[compare_idx]])
+    return AssetPair(
+        src_asset=src_data,
+        compare_asset=compare_data,
+        index_ns=index_ns,
+        ret_arr=np.vstack([src_data.ret_arr[src_idx], compare_data.ret_arr[compare_idx]]),
+        norm_close_arr=close_arr / close_arr[:, :1] * 100.0,
+        min_date=pd.Timestamp(index_ns[0]).date(),
+        max_date=pd.Timestamp(index_ns[-1]).date(),
+    )
+
+
+def window_returns(ret_arr: np.ndarray, index_ns: np.ndarray, start_date: date, end_date: date) -> np.ndarray:
+    """
+    Compute the cumulative log returns between two dates (inclusive).
+
+    Both endpoints are found with a single binary search on the sorted index instead of
+    slicing the data, and the returns of every row of ret_arr are computed at once.
 
+    Args:
+        ret_arr: Cumulative log returns (in %), with dates along the last axis
+        index_ns: Sorted dates of ret_arr as int64 nanoseconds
+        start_date: First date of the window
+        end_date: Last date of the window
 
-def compare_crypto_assets(src_asset: str, compare_asset: str, default_days: int = 365) -> ComparisonResult:
+    Returns:
+        The log returns (in %) over the window, one per row of ret_arr
+    """
+    # Searching for the nanosecond after end_date finds the first date past the window
+    bounds = np.array([start_date, end_date], dtype="datetime64[ns]").astype(np.int64) + [0, 1]
+    i0, i1 = np.searchsorted(index_ns, bounds)
+    return ret_arr[..., i1 - 1] - ret_arr[..., i0]
+
+
+def lttb_indices(dates: np.ndarray, values: np.ndarray, n_out: int = MAX_PLOT_POINTS) -> np.ndarray:
+    """
+    Select the points to keep when downsampling a time series with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. Every other output point is the point of
+    its bucket that forms the largest triangle with the previously selected point and
+    the average of the next bucket, which preserves the visual shape of the series.
+
+    Args:
+        dates: Sorted datetime64 x values
+        values: y values
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted indices of the points to keep; all of them if the series is already small enough
+    """
+    n = len(values)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = dates.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    y = values.astype(np.float64, copy=False)
+
+    # Edges of the n_out - 2 inner buckets; the last edge starts the final one-point bucket
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+        areas = np.abs((x[prev] - avg_x) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (avg_y - y[prev]))
+        prev = lo + int(np.argmax(areas))
+        selected[i + 1] = prev
+
+    return selected
+
+
+def compare_crypto_assets(pair: AssetPair, default_days: int = 365) -> ComparisonResult:
     """
     Compare two cryptocurrency assets and prepare visualization data.
 
     Args:
-        src_asset: Source asset symbol (e.g., 'BTC')
-        compare_asset: Comparison asset symbol (e.g., 'ETH')
+        pair: The aligned data of the source (e.g., BTC) and comparison (e.g., ETH) assets
         default_days: Default number of days for the comparison period
 
     Returns:
         ComparisonResult object containing processed comparison data
     """
-    # Fetch data for both assets
-    src_data = get_crypto_data(src_asset)
-    compare_data = get_crypto_data(compare_asset)
+    src_data, compare_data = pair.src_asset, pair.compare_asset
+    src_asset, compare_asset = src_data.symbol, compare_data.symbol
 
     # Define date range based on overlapping dates
-    min_date = max(src_data.min_date, compare_data.min_date)
-    max_date = min(src_data.max_date, compare_data.max_date)
+    min_date = pair.min_date
+    max_date = pair.max_date
 
     # Set default date range
     default_end_date = max_date
@@ -98,92 +319,171 @@ def compare_crypto_assets(src_asset: str, compare_asset: str, default_days: int
     if default_start_date < min_date:
         default_start_date = min_date
 
-    # Create date selector with auto-generated key
+    # Create date selector with auto-generated key. Loading the full history (from any pair
+    # sharing an asset) changes the slider bounds, and the rerun it triggers drops the state
+    # of sliders not rendered yet, both of which reset it, so its initial value is the last
+    # selected range whenever that happens.
     slider_key = f"{src_asset.lower()}_{compare_asset.lower()}_slider"
+    selected_range_key = f"{slider_key}_selected_range"
+    value_key = f"{slider_key}_value"
+    bounds, value = st.session_state.get(value_key, (None, None))
+    if bounds != (min_date, max_date) or slider_key not in st.session_state:
+        start, end = st.session_state.get(selected_range_key, (default_start_date, default_end_date))
+        value = (min(max(start, min_date), max_date), min(max(end, min_date), max_date))
+        st.session_state[value_key] = ((min_date, max_date), value)
     start_date, end_date = st.slider(
         f"Select Date Range for {src_asset} vs {compare_asset}:",
-        min_value=min_date.date(),
-        max_value=max_date.date(),
-        value=(default_start_date.date(), default_end_date.date()),
+        min_value=min_date,
+        max_value=max_date,
+        value=value,
         format="YYYY-MM-DD",
         key=slider_key,
     )
-
-    # Filter data and calculate returns
-    for asset in [src_data, compare_data]:
-        filtered_data = asset.data.loc[start_date:end_date]
-        asset.return_value = filtered_data["Return"].iloc[-1] - filtered_data["Return"].iloc[0]
-        asset.return_color = "green" if asset.return_value >= 0 else "red"
+    st.session_state[selected_range_key] = (start_date, end_date)
+
+    # Only the recent history is loaded by default; load the full history once the selected
+    # range reaches its start
+    full_history = st.session_state.setdefault("full_history", set())
+    if start_date <= min_date and not {src_asset, compare_asset} <= full_history:
+        try:
+            with st.spinner("Loading full history…"):
+                fetch_crypto_data([src_asset, compare_asset], full_history={src_asset, compare_asset})
+        except Exception:
+            st.warning(f"Couldn't load the full history of {src_asset} and {compare_asset}, showing the recent one.")
+        else:
+            full_history.update({src_asset, compare_asset})
+            st.rerun()
+
+    # Calculate the returns of both assets at once, unless neither the selected range nor the
+    # data changed since the previous rerun (e.g., when another widget was interacted with)
+    returns_key = f"{slider_key}_returns"
+    data_key = (src_data.min_date, src_data.max_date, compare_data.min_date, compare_data.max_date)
+    range_key = (start_date, end_date, data_key)
+    last_range_key, returns = st.session_state.get(returns_key, (None, None))
+    if last_range_key != range_key:
+        returns = (np.exp(window_returns(pair.ret_arr, pair.index_ns, start_date, end_date) / 100.0) - 1.0) * 100.0
+        returns = returns.tolist()
+        st.session_state[returns_key] = (range_key, returns)
+    src_return, compare_return = returns
 
     return ComparisonResult(
         start_date=pd.Timestamp(start_date),
         end_date=pd.Timestamp(end_date),
-        src_asset=src_data,
-        compare_asset=compare_data,
+        pair=pair,
+        src_return=src_return,
+        compare_return=compare_return,
     )
 
 
-def display_comparison(result: ComparisonResult) -> None:
+@st.cache_resource
+def build_price_figure(src_symbol: str, compare_symbol: str, dates: np.ndarray, norm_close_arr: np.ndarray) -> Dict:
     """
-    Display the cryptocurrency comparison results.
+    Build the price comparison chart of two assets.
+
+    Both prices are indexed to 100 on the first date, so they share a single y-axis. The
+    figure doesn't depend on the selected date range, so it is built once and shared
+    across reruns and sessions. Since it is shared, it must never be mutated; use
+    with_xaxis_range to get a copy to plot.
 
     Args:
-        result: ComparisonResult object containing the comparison data
+        src_symbol: Source asset symbol
+        compare_symbol: Comparison asset symbol
+        dates: Dates shared by both assets
+        norm_close_arr: Indexed close prices, one row per asset (2 x N)
+
+    Returns:
+        The Plotly figure as a dict, without an x-axis range
     """
-    # Display returns
-    for asset in sorted(
-        [result.src_asset, result.compare_asset],
-        key=lambda x: x.return_value or 0,
-        reverse=True,
-    ):
-        heading = get_heading_level(asset.return_value or 0)
-        return_text = (
-            f"{heading} {asset.symbol} Return: " f"<b style='color:{asset.return_color};'>{asset.return_value:.2f}%</b>"
-        )
-        st.markdown(return_text, unsafe_allow_html=True)
+    # Downsample the traces to keep the payload sent to the browser small, keeping the points
+    # selected for either asset so that both traces share the same dates
+    selected = np.union1d(
+        lttb_indices(dates, norm_close_arr[0], MAX_PLOT_POINTS // 2),
+        lttb_indices(dates, norm_close_arr[1], MAX_PLOT_POINTS // 2),
+    )
+    x = dates[selected]
 
-    # Create price comparison chart
     fig = go.Figure()
 
-    # Add source asset trace
-    fig.add_trace(
-        go.Scatter(
-            x=result.src_asset.data.index,
-            y=result.src_asset.data["Close"].squeeze().tolist(),
-            mode="lines",
-            name=f"{result.src_asset.symbol} Price",
+    # Add a trace per asset
+    for symbol, y in zip([src_symbol, compare_symbol], norm_close_arr[:, selected]):
+        fig.add_trace(
+            go.Scatter(
+                x=x,
+                y=y,
+                mode="lines",
+                name=f"{symbol} Price",
+            )
         )
-    )
-
-    # Add comparison asset trace
-    fig.add_trace(
-        go.Scatter(
-            x=result.compare_asset.data.index,
-            y=result.compare_asset.data["Close"].squeeze().tolist(),
-            mode="lines",
-            name=f"{result.compare_asset.symbol} Price",
-            yaxis="y2",
-        )
-    )
 
     # Configure layout
     fig.update_layout(
-        yaxis=dict(title=f"{result.src_asset.symbol} Price (USD)"),
-        yaxis2=dict(
-            title=f"{result.compare_asset.symbol} Price (USD)",
-            overlaying="y",
-            side="right",
-        ),
+        yaxis=dict(title=f"Price (indexed to 100 on {pd.Timestamp(dates[0]).date()})"),
         xaxis=dict(
             title="Date",
             rangeslider=dict(visible=True),
-            range=[result.start_date, result.end_date],
         ),
-        title=f"{result.src_asset.symbol} vs {result.compare_asset.symbol} Price Comparison",
+        title=f"{src_symbol} vs {compare_symbol} Price Comparison",
         legend=dict(orientation="v", x=1.05, y=1),
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig.to_dict()
+
+
+def with_xaxis_range(fig: Dict, start_date: datetime, end_date: datetime) -> Dict:
+    """
+    Copy a figure dict with its x-axis range set.
+
+    Only the dicts leading to the x-axis are copied, so the (large) trace data stays shared
+    with the input, which is left untouched.
+
+    Args:
+        fig: The Plotly figure as a dict
+        start_date: Start of the x-axis range
+        end_date: End of the x-axis range
+
+    Returns:
+        The Plotly figure as a dict, with its x-axis range set
+    """
+    layout = fig["layout"]
+    return {**fig, "layout": {**layout, "xaxis": {**layout["xaxis"], "range": [start_date, end_date]}}}
+
+
+def display_comparison(result: ComparisonResult) -> None:
+    """
+    Display the cryptocurrency comparison results.
+
+    Args:
+        result: ComparisonResult object containing the comparison data
+    """
+    pair = result.pair
+
+    # Display returns side by side, best performing asset first
+    returns = sorted(
+        [(pair.src_asset, result.src_return), (pair.compare_asset, result.compare_return)],
+        key=lambda x: x[1],
+        reverse=True,
+    )
+    for column, (asset, return_value) in zip(st.columns(len(returns)), returns):
+        with column:
+            st.metric(f"{asset.symbol} Return", f"{return_value:.2f}%", delta=f"{return_value:+.2f}%")
+
+    # Only the x-axis range depends on the selected dates; the rest of the figure is cached.
+    # The cached figure dict is also kept in the session, which skips hashing the data to look
+    # it up in the cache as long as the data doesn't change. It is shared with other sessions,
+    # so the range is only ever set on a per-run copy.
+    src_data, compare_data = pair.src_asset, pair.compare_asset
+    figure_key = f"{src_data.symbol.lower()}_{compare_data.symbol.lower()}_figure"
+    data_key = (src_data.min_date, src_data.max_date, compare_data.min_date, compare_data.max_date)
+    last_data_key, fig_dict = st.session_state.get(figure_key, (None, None))
+    if last_data_key != data_key:
+        fig_dict = build_price_figure(
+            src_data.symbol,
+            compare_data.symbol,
+            pair.index_ns.view("datetime64[ns]"),
+            pair.norm_close_arr,
+        )
+        st.session_state[figure_key] = (data_key, fig_dict)
+    st.plotly_chart(with_xaxis_range(fig_dict, result.start_date, result.end_date), use_container_width=True)
     st.warning(
         """
         ⚠️ Updating the range slider in the plot doesn't update the whole page. ⚠️
@@ -197,28 +497,48 @@ def display_comparison(result: ComparisonResult) -> None:
 
     # Display data availability info
     st.write("---")
-    for asset in [result.src_asset, result.compare_asset]:
-        st.write(f"*{asset.symbol} data available from " f"`{asset.min_date.date()}` to `{asset.max_date.date()}`*")
+    for asset in [pair.src_asset, pair.compare_asset]:
+        st.write(f"*{asset.symbol} data available from " f"`{asset.min_date}` to `{asset.max_date}`*")
+
+
+@st.fragment
+def render_comparison(pair: AssetPair) -> None:
+    """
+    Compare two cryptocurrency assets and display the results.
+
+    Runs as a fragment, so interacting with the date slider only reruns this comparison
+    instead of the whole app.
+
+    Args:
+        pair: The aligned data of the source (e.g., BTC) and comparison (e.g., ETH) assets
+    """
+    result = compare_crypto_assets(pair)
+    display_comparison(result)
 
 
 def main():
     """Main application entry point."""
     st.title("Crypto Return Comparison")
 
+    # Fetch the data of all assets concurrently
+    full_history = st.session_state.setdefault("full_history", set())
+    try:
+        assets = fetch_crypto_data(["BTC", "ETH", "SOL"], full_history)
+    except ValueError as e:
+        st.error(str(e))
+        st.stop()
+
     # Create tabs
     tab1, tab2, tab3 = st.tabs(["BTC vs ETH", "BTC vs SOL", "ETH vs SOL"])
 
     with tab1:
-        result = compare_crypto_assets("BTC", "ETH")
-        display_comparison(result)
+        render_comparison(align_assets(assets["BTC"], assets["ETH"]))
 
     with tab2:
-        result = compare_crypto_assets("BTC", "SOL")
-        display_comparison(result)
+        render_comparison(align_assets(assets["BTC"], assets["SOL"]))
 
     with tab3:
-        result = compare_crypto_assets("ETH", "SOL")
-        display_comparison(result)
+        render_comparison(align_assets(assets["ETH"], assets["SOL"]))
 
 
 if __name__ == "__main__":